@@ -1,26 +1,168 @@
+import argparse
+import base64
 import csv
-import random
+import secrets
+import sqlite3
 import string
+import struct
 import subprocess
 import os
-from datetime import datetime, timedelta
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 import tkinter as tk
 from tkinter import messagebox
-from playwright.sync_api import sync_playwright
+
+class LicenseRegistry:
+    """SQLite store of every issued license key; License_keys.csv is only exported from it."""
+
+    MAX_KEY_ATTEMPTS = 10
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.init_schema()
+
+    @contextmanager
+    def transaction(self):
+        """Yields a cursor and commits on success or rolls back on error."""
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def init_schema(self):
+        """Creates the key table; the unique indexes keep keys and invoice numbers from ever repeating."""
+        with self.transaction() as cursor:
+            cursor.execute(""" CREATE TABLE IF NOT EXISTS license_keys (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                license_key TEXT NOT NULL,
+                expiration_date TEXT NOT NULL,
+                customer_name TEXT,
+                phone_number TEXT,
+                months INTEGER,
+                fee INTEGER,
+                invoice_number TEXT,
+                issued_at TEXT NOT NULL DEFAULT (datetime('now')),
+                revoked INTEGER NOT NULL DEFAULT 0)
+            """)
+            cursor.execute(" CREATE UNIQUE INDEX IF NOT EXISTS idx_license_keys_key ON license_keys (license_key) ")
+            cursor.execute(" CREATE UNIQUE INDEX IF NOT EXISTS idx_license_keys_invoice ON license_keys (invoice_number) ")
+
+            cursor.execute(" PRAGMA table_info(license_keys) ")
+            if "revoked" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute(" ALTER TABLE license_keys ADD COLUMN revoked INTEGER NOT NULL DEFAULT 0 ")
+
+            # Invoice numbers come from their own counter, so only issued keys use one up. Registries that
+            # numbered invoices by row id continue after the highest of those.
+            cursor.execute(" CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL) ")
+            cursor.execute(""" INSERT OR IGNORE INTO counters (name, value)
+                SELECT 'invoice', COALESCE(MAX(id), 0) FROM license_keys WHERE invoice_number IS NOT NULL """)
+
+    def import_csv(self, csv_file_path):
+        """Seeds an empty registry from an existing License_keys.csv, without customer details.
+
+        Rows whose date is not a date, such as REVOKED, are imported as revoked.
+        """
+        if not os.path.isfile(csv_file_path):
+            return
+        with self.transaction() as cursor:
+            cursor.execute(" SELECT EXISTS (SELECT 1 FROM license_keys) ")
+            if cursor.fetchone()[0]:
+                return
+            rows = []
+            with open(csv_file_path, newline="") as file:
+                for row in csv.DictReader(file):
+                    if not row["License Key"]:
+                        continue
+                    try:
+                        expiration_date, revoked = datetime.strptime(row["Expiration Date"].strip(), "%d-%m-%Y").date(), 0
+                    except ValueError:
+                        expiration_date, revoked = date.today(), 1
+                    rows.append((row["License Key"].strip(), expiration_date.isoformat(), revoked))
+            cursor.executemany(" INSERT OR IGNORE INTO license_keys (license_key, expiration_date, revoked) VALUES (?, ?, ?) ", rows)
+
+    def issue(self, cursor, generate_key, expiration_date, customer_name, phone_number, months, fee):
+        """Stores a key from generate_key(expiration_date), drawing again on a collision; returns (key, invoice number)."""
+        for _ in range(self.MAX_KEY_ATTEMPTS):
+            license_key = generate_key(expiration_date)
+            try:
+                cursor.execute(""" INSERT INTO license_keys (license_key, expiration_date, customer_name, phone_number, months, fee)
+                    VALUES (?, ?, ?, ?, ?, ?) """,
+                    (license_key, expiration_date.isoformat(), customer_name, phone_number, months, fee))
+            except sqlite3.IntegrityError:
+                continue
+
+            row_id = cursor.lastrowid
+            cursor.execute(" UPDATE counters SET value = value + 1 WHERE name = 'invoice' ")
+            cursor.execute(" SELECT value FROM counters WHERE name = 'invoice' ")
+            invoice_number = f"INV{date.today().strftime('%Y%m%d')}{cursor.fetchone()[0]:05d}"
+            cursor.execute(" UPDATE license_keys SET invoice_number = ? WHERE id = ? ", (invoice_number, row_id))
+            return license_key, invoice_number
+
+        raise RuntimeError(f"No unused license key after {self.MAX_KEY_ATTEMPTS} attempts.")
+
+    def revoke(self, cursor, license_key):
+        """Marks a key as revoked; returns False if the registry does not know it."""
+        cursor.execute(" UPDATE license_keys SET revoked = 1 WHERE license_key = ? ", (license_key.strip(),))
+        return cursor.rowcount == 1
+
+    def find(self, license_key):
+        """Returns the stored row of a key through its unique index, or None."""
+        cursor = self.conn.execute(""" SELECT license_key, expiration_date, customer_name, phone_number, months, fee, invoice_number, issued_at, revoked
+            FROM license_keys WHERE license_key = ? """, (license_key.strip(),))
+        return cursor.fetchone()
+
+    def export_csv(self, csv_file_path):
+        """Writes every key as the "License Key,Expiration Date" CSV the app reads, replacing the file in one step.
+
+        Revoked keys are listed with REVOKED instead of a date.
+        """
+        temp_path = f"{csv_file_path}.tmp"
+        with open(temp_path, mode="w", newline="") as file:
+            writer = csv.writer(file, lineterminator="\n")
+            writer.writerow(["License Key", "Expiration Date"])
+            for license_key, expiration_date, revoked in self.conn.execute(" SELECT license_key, expiration_date, revoked FROM license_keys ORDER BY id "):
+                writer.writerow([license_key, "REVOKED" if revoked else date.fromisoformat(expiration_date).strftime("%d-%m-%Y")])
+        os.replace(temp_path, csv_file_path)
+
+    def close(self):
+        self.conn.close()
 
 class LicenseKeyGenerator:
     CSV_FILE_NAME = "License_keys.csv"
     REPO_PATH = r"C:\Users\mayan\OneDrive\Documents\VS\Python Scripts\Gym Manager"
     output_folder = os.path.join(REPO_PATH, "Invoice's")
-    os.makedirs(output_folder, exist_ok=True)
+    GIT_REMOTE = "origin"
+    GIT_BRANCH = "master"
+    EDGE_PATH = r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"
     EXPIRATION_OPTIONS = {"1 Month": 1, "3 Month's": 3, "6 Month's": 6, "12 Month's": 12}
     SUBSCRIPTION_FEES = {1: 380, 3: 846, 6: 1270, 12: 1694}
+    # Kept outside REPO_PATH: the repository is public, the signing key must never be pushed.
+    SIGNING_KEY_FILE = os.environ.get("GYM_LICENSE_SIGNING_KEY",
+        os.path.join(os.path.expanduser("~"), ".gym-manager", "license_signing_key.pem"))
+    # Holds customer names and phone numbers, so it stays out of the public repository as well.
+    REGISTRY_FILE = os.environ.get("GYM_LICENSE_REGISTRY",
+        os.path.join(os.path.expanduser("~"), ".gym-manager", "license_keys.db"))
+    # Signed key layout, shared with GYM-MANAGER.py: a version byte, 4 random id bytes and the expiry in days
+    # since LICENSE_EPOCH, then the 64-byte Ed25519 signature of those 7 bytes, all in unpadded base32.
+    LICENSE_KEY_VERSION = 1
+    LICENSE_EPOCH = date(2024, 1, 1)
+    LICENSE_PAYLOAD = struct.Struct(">B4sH")
 
     def __init__(self, root):
         self.root = root
         self.root.title("License Key Generator")
         self.root.geometry("+500+100")
         self.root.resizable(False, False)
+        self.registry = LicenseRegistry(self.REGISTRY_FILE)
+        self.registry.import_csv(os.path.join(self.REPO_PATH, self.CSV_FILE_NAME))
         self._setup_ui()
 
     def _setup_ui(self):
@@ -48,7 +190,8 @@ class LicenseKeyGenerator:
         entry.pack(pady=5)
         return entry
 
-    def validate_input(self, input_str, mode):
+    @staticmethod
+    def validate_input(input_str, mode):
         """Validates input based on the specified mode (numeric or letters)."""
         if mode == "numeric":
             return (input_str.isdigit() and len(input_str) <= 10) or input_str == ""
@@ -56,37 +199,82 @@ class LicenseKeyGenerator:
             return all(char.isalpha() or char.isspace() for char in input_str)
         return False
 
-    def generate_license_key(self):
-        """Generate a random license key in the format AAAA-1234-BBBB-1234."""
-        return "-".join([
-            "".join(random.choices(string.ascii_uppercase, k=4)),
-            "".join(random.choices(string.digits, k=4)),
-            "".join(random.choices(string.ascii_uppercase, k=4)),
-            "".join(random.choices(string.digits, k=4)) ])
+    @classmethod
+    def init_signing_key(cls):
+        """Create the Ed25519 signing key if it does not exist yet and return its public key as hex."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+        if not os.path.isfile(cls.SIGNING_KEY_FILE):
+            os.makedirs(os.path.dirname(cls.SIGNING_KEY_FILE), exist_ok=True)
+            pem = Ed25519PrivateKey.generate().private_bytes(serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+            with os.fdopen(os.open(cls.SIGNING_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as file:
+                file.write(pem)
+
+        return cls.load_signing_key().public_key().public_bytes(serialization.Encoding.Raw,
+            serialization.PublicFormat.Raw).hex()
+
+    @classmethod
+    def load_signing_key(cls):
+        """Load the Ed25519 private key, or return None when none has been created on this machine."""
+        from cryptography.hazmat.primitives import serialization
+
+        if not os.path.isfile(cls.SIGNING_KEY_FILE):
+            return None
+        with open(cls.SIGNING_KEY_FILE, "rb") as file:
+            return serialization.load_pem_private_key(file.read(), password=None)
+
+    @classmethod
+    def generate_license_key(cls, expiration_date=None, signing_key=None):
+        """Generate a license key signed with its expiration date, or a random AAAA-1234-BBBB-1234 key when no signing key exists.
+
+        Both draw from the secrets CSPRNG; LicenseRegistry.issue retries the rare key that is already taken.
+        """
+        if signing_key is None and expiration_date is not None:
+            signing_key = cls.load_signing_key()
+        if signing_key is not None:
+            days = (expiration_date - cls.LICENSE_EPOCH).days
+            payload = cls.LICENSE_PAYLOAD.pack(cls.LICENSE_KEY_VERSION, secrets.token_bytes(4), days)
+            encoded = base64.b32encode(payload + signing_key.sign(payload)).decode("ascii").rstrip("=")
+            return "-".join(encoded[i : i + 4] for i in range(0, len(encoded), 4))
 
-    def save_key_to_csv(self, license_key, expiration_date):
-        """Save the license key and expiration date to a CSV file."""
+        return "-".join([
+            "".join(secrets.choice(string.ascii_uppercase) for _ in range(4)),
+            "".join(secrets.choice(string.digits) for _ in range(4)),
+            "".join(secrets.choice(string.ascii_uppercase) for _ in range(4)),
+            "".join(secrets.choice(string.digits) for _ in range(4)) ])
+
+    @classmethod
+    def expiration_for(cls, months):
+        """Expiration date of a license bought today for the given number of months."""
+        return datetime.now().date() + timedelta(days=30 * months)
+
+    def issue_license_key(self, expiration_date, months, name, number):
+        """Store a new key in the registry and export License_keys.csv; returns (key, invoice number) or None."""
         csv_file_path = os.path.join(self.REPO_PATH, self.CSV_FILE_NAME)
-        file_exists = os.path.isfile(csv_file_path)
-
         try:
-            with open(csv_file_path, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                if not file_exists:
-                    writer.writerow(["License Key", "Expiration Date"])
-                writer.writerow([license_key, expiration_date])
-            return True  # Return True if successful
-        except IOError as e:
-            messagebox.showerror("File Error", f"Failed to save license key: {str(e)}")
-            return False  # Return False if failed
+            with self.registry.transaction() as cursor:
+                issued = self.registry.issue(cursor, self.generate_license_key, expiration_date,
+                    name, number, months, self.SUBSCRIPTION_FEES.get(months, 0))
+            self.registry.export_csv(csv_file_path)
+            return issued
+        except (sqlite3.Error, RuntimeError, IOError) as e:
+            messagebox.showerror("Registry Error", f"Failed to save license key: {str(e)}")
+            return None
+
+    @classmethod
+    def publish_keys(cls, message, repo_path=None, remote=None, branch=None):
+        """Commit the exported CSV and push it; raises CalledProcessError when a git command fails."""
+        git = ["git", "-C", repo_path or cls.REPO_PATH]
+        subprocess.run(git + ["add", cls.CSV_FILE_NAME], check=True)
+        subprocess.run(git + ["commit", "-m", message], check=True)
+        subprocess.run(git + ["push", remote or cls.GIT_REMOTE, f"HEAD:{branch or cls.GIT_BRANCH}"], check=True)
 
     def git_commit_and_push(self):
         """Commit and push CSV to GitHub."""
         try:
-            os.chdir(self.REPO_PATH)
-            subprocess.run(["git", "add", self.CSV_FILE_NAME], check=True)
-            subprocess.run(["git", "commit", "-m", "Add new license key"], check=True)
-            subprocess.run(["git", "push", "origin", "master"], check=True)
+            self.publish_keys("Add new license key")
             return True  # Return True if successful
         except subprocess.CalledProcessError as e:
             messagebox.showerror("Git Error", f"Git command failed: {str(e)}")
@@ -95,10 +283,46 @@ class LicenseKeyGenerator:
             messagebox.showerror("Unexpected Error", f"Error during Git push: {str(e)}")
             return False  # Return False if failed
 
-    def generate_pdf_invoice(self, license_key, expiration_date, months, name, number):
+    def generate_pdf_invoice(self, license_key, expiration_date, months, name, number, invoice_number):
         """Generate a PDF invoice for the license key."""
+        try:
+            self.render_invoices([(license_key, expiration_date, months, name, number, invoice_number)])
+            messagebox.showinfo("Success", "Invoice PDF generated successfully.")
+            return True  # Return True if successful
+        except Exception as e:
+            messagebox.showerror("PDF Error", f"Failed to generate PDF: {str(e)}")
+            return False  # Return False if failed
+
+    @classmethod
+    def render_invoices(cls, invoices, output_folder=None):
+        """Print each (key, expiration, months, name, number, invoice number) invoice to PDF in one browser session."""
+        from playwright.sync_api import sync_playwright
+
+        output_folder = output_folder or cls.output_folder
+        os.makedirs(output_folder, exist_ok=True)
+        pdf_paths = []
+
+        with sync_playwright() as p:
+            # Edge where it is installed, otherwise Playwright's own Chromium.
+            edge_path = cls.EDGE_PATH if os.path.isfile(cls.EDGE_PATH) else None
+            browser = p.chromium.launch(executable_path=edge_path, headless=True)
+            try:
+                page = browser.new_page()
+                for invoice in invoices:
+                    page.set_content(cls.invoice_html(*invoice))
+                    pdf_path = os.path.join(output_folder, f'Invoice_{invoice[5]}_{datetime.now().strftime("%d-%m-%Y")}.pdf')
+                    page.pdf(path=pdf_path, format='A4')
+                    pdf_paths.append(pdf_path)
+            finally:
+                browser.close()
+
+        return pdf_paths
+
+    @classmethod
+    def invoice_html(cls, license_key, expiration_date, months, name, number, invoice_number):
+        """Fill in the HTML invoice for a license key."""
         # Subscription fee based on months selected
-        subscription_fee = self.SUBSCRIPTION_FEES.get(months, 0)
+        subscription_fee = cls.SUBSCRIPTION_FEES.get(months, 0)
         subscription_type = f"{months} month{'s' if months != 1 else ''}"
 
         # Format the phone number
@@ -112,7 +336,6 @@ class LicenseKeyGenerator:
         total_amount = round(subscription_fee + gst, 2)
 
         # Invoice details
-        invoice_number = f"INV{datetime.now().strftime('%Y%m%d')}{random.randint(1, 100)}{license_key.strip()[:3]}"
         date = datetime.now().strftime('%d-%m-%Y')
 
         # Prepare the HTML content for the invoice
@@ -319,27 +542,7 @@ class LicenseKeyGenerator:
 </html>
         """
 
-        # Use Playwright to generate the PDF
-        with sync_playwright() as p:
-            edge_path = r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"
-            try:
-                browser = p.chromium.launch(executable_path=edge_path, headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-                page.set_content(html_content)
-
-                # Define PDF path
-                pdf_path = os.path.join(self.output_folder, f'Invoice_{invoice_number}_{datetime.now().strftime("%d-%m-%Y")}.pdf')
-                page.pdf(path=pdf_path, format='A4')
-
-                messagebox.showinfo("Success", "Invoice PDF generated successfully.")
-                return True  # Return True if successful
-            except Exception as e:
-                messagebox.showerror("PDF Error", f"Failed to generate PDF: {str(e)}")
-                return False  # Return False if failed
-            finally:
-                context.close()
-                browser.close()
+        return html_content
 
     def generate_key(self):
         """Generate a license key, handle CSV save, Git push, and PDF generation."""
@@ -357,14 +560,15 @@ class LicenseKeyGenerator:
                 return
 
             months = self.EXPIRATION_OPTIONS[duration]
-            license_key = self.generate_license_key()
-            expiration_date = (datetime.now() + timedelta(days=30 * months)).strftime("%d-%m-%Y")
+            expiration = self.expiration_for(months)
+            expiration_date = expiration.strftime("%d-%m-%Y")
 
-            # Step 2: Save to CSV
-            if not self.save_key_to_csv(license_key, expiration_date):
-                messagebox.showerror("CSV Error", "Failed to save license key to CSV.")
+            # Step 2: Save to the registry and export the CSV
+            issued = self.issue_license_key(expiration, months, name, phone)
+            if issued is None:
                 self.generate_button.config(state="normal")
                 return
+            license_key, invoice_number = issued
 
             # Step 3: Git commit and push
             if not self.git_commit_and_push():
@@ -373,7 +577,7 @@ class LicenseKeyGenerator:
                 return
 
             # Step 4: Generate PDF invoice
-            if not self.generate_pdf_invoice(license_key, expiration_date, months, name, phone):
+            if not self.generate_pdf_invoice(license_key, expiration_date, months, name, phone, invoice_number):
                 messagebox.showerror("PDF Error", "Failed to generate PDF.")
                 self.generate_button.config(state="normal")
                 return
@@ -386,7 +590,124 @@ class LicenseKeyGenerator:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
 
+def add_publishing_arguments(parser):
+    parser.add_argument("--repo", default=LicenseKeyGenerator.REPO_PATH, help="git working copy that publishes License_keys.csv")
+    parser.add_argument("--remote", default=LicenseKeyGenerator.GIT_REMOTE, help="remote name or URL to push to")
+    parser.add_argument("--branch", default=LicenseKeyGenerator.GIT_BRANCH, help="branch to push to")
+    parser.add_argument("--registry", default=LicenseKeyGenerator.REGISTRY_FILE, help="SQLite key registry")
+
+def batch_issue(argv):
+    """Issue keys for every customer in a Name,Phone,Months CSV and print them as CSV.
+
+    All keys are written in one registry transaction and published with one commit and push. All
+    invoices are printed in one browser session. Nothing is issued if any row is invalid.
+    """
+    parser = argparse.ArgumentParser(prog="LicenseKeyGenerator.py", description="Issue license keys for a batch of customers.")
+    parser.add_argument("--batch", required=True, metavar="CSV", help="customers file with Name, Phone and Months columns")
+    add_publishing_arguments(parser)
+    parser.add_argument("--invoices", metavar="FOLDER", help="where to write the PDF invoices (default: Invoice's in the repo)")
+    parser.add_argument("--no-invoices", action="store_true", help="skip the PDF invoices")
+    args = parser.parse_args(argv)
+
+    customers = []
+    with open(args.batch, newline="", encoding="utf-8-sig") as file:
+        for line, row in enumerate(csv.DictReader(file), start=2):
+            name = (row.get("Name") or "").strip()
+            phone = (row.get("Phone") or "").strip()
+            months = (row.get("Months") or "").strip()
+            if (len(name) < 3 or not LicenseKeyGenerator.validate_input(name, "letters")
+                    or not phone or not LicenseKeyGenerator.validate_input(phone, "numeric")
+                    or not months.isdigit() or int(months) not in LicenseKeyGenerator.SUBSCRIPTION_FEES):
+                print(f"{args.batch}:{line}: expected a name, a phone number of up to 10 digits and months in "
+                    f"{sorted(LicenseKeyGenerator.SUBSCRIPTION_FEES)}, got {name!r}, {phone!r}, {months!r}", file=sys.stderr)
+                return 1
+            customers.append((name, phone, int(months)))
+
+    if not customers:
+        print(f"{args.batch}: no customers to issue keys for", file=sys.stderr)
+        return 1
+
+    registry = LicenseRegistry(args.registry)
+    csv_file_path = os.path.join(args.repo, LicenseKeyGenerator.CSV_FILE_NAME)
+    try:
+        registry.import_csv(csv_file_path)
+        signing_key = LicenseKeyGenerator.load_signing_key()
+        generate = lambda expiration_date: LicenseKeyGenerator.generate_license_key(expiration_date, signing_key)
+
+        invoices = []
+        with registry.transaction() as cursor:
+            for name, phone, months in customers:
+                expiration = LicenseKeyGenerator.expiration_for(months)
+                license_key, invoice_number = registry.issue(cursor, generate, expiration, name, phone, months,
+                    LicenseKeyGenerator.SUBSCRIPTION_FEES[months])
+                invoices.append((license_key, expiration.strftime("%d-%m-%Y"), months, name, phone, invoice_number))
+        registry.export_csv(csv_file_path)
+    finally:
+        registry.close()
+
+    # Printed before publishing so the keys are at hand even if the push has to be retried by hand.
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(["Name", "Phone", "Months", "License Key", "Expiration Date", "Invoice Number"])
+    for license_key, expiration_date, months, name, phone, invoice_number in invoices:
+        writer.writerow([name, phone, months, license_key, expiration_date, invoice_number])
+    sys.stdout.flush()
+
+    try:
+        LicenseKeyGenerator.publish_keys(f"Add {len(invoices)} license keys", args.repo, args.remote, args.branch)
+    except subprocess.CalledProcessError as e:
+        print(f"Git command failed: {str(e)}; the keys are saved in {args.registry}", file=sys.stderr)
+        return 1
+
+    if not args.no_invoices:
+        try:
+            LicenseKeyGenerator.render_invoices(invoices, args.invoices or os.path.join(args.repo, "Invoice's"))
+        except Exception as e:
+            print(f"Failed to generate PDF invoices: {str(e)}", file=sys.stderr)
+            return 1
+    return 0
+
+def revoke_keys(argv):
+    """Mark license keys as revoked in the registry and publish them as REVOKED, which the app refuses."""
+    parser = argparse.ArgumentParser(prog="LicenseKeyGenerator.py", description="Revoke issued license keys.")
+    parser.add_argument("--revoke", required=True, nargs="+", metavar="KEY", help="license keys to revoke")
+    add_publishing_arguments(parser)
+    args = parser.parse_args(argv)
+
+    registry = LicenseRegistry(args.registry)
+    csv_file_path = os.path.join(args.repo, LicenseKeyGenerator.CSV_FILE_NAME)
+    try:
+        registry.import_csv(csv_file_path)
+        unknown = [license_key for license_key in args.revoke if registry.find(license_key) is None]
+        if unknown:
+            print(f"Unknown license keys: {', '.join(unknown)}; nothing was revoked", file=sys.stderr)
+            return 1
+        with registry.transaction() as cursor:
+            for license_key in args.revoke:
+                registry.revoke(cursor, license_key)
+        registry.export_csv(csv_file_path)
+    finally:
+        registry.close()
+
+    try:
+        LicenseKeyGenerator.publish_keys(f"Revoke {len(args.revoke)} license keys", args.repo, args.remote, args.branch)
+    except subprocess.CalledProcessError as e:
+        print(f"Git command failed: {str(e)}; the revocations are saved in {args.registry}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
+    if "--batch" in sys.argv:
+        sys.exit(batch_issue(sys.argv[1:]))
+
+    if "--revoke" in sys.argv:
+        sys.exit(revoke_keys(sys.argv[1:]))
+
+    if "--init-signing-key" in sys.argv:
+        print(f"Signing key: {LicenseKeyGenerator.SIGNING_KEY_FILE}")
+        print(f"Set LICENSE_PUBLIC_KEY in GYM-MANAGER.py to: {LicenseKeyGenerator.init_signing_key()}")
+        sys.exit(0)
+
     root = tk.Tk()
     app = LicenseKeyGenerator(root)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Measures how long the background takes to appear at a window size, from a cold start and from each cache.
+
+"cold" decodes background.jpg and scales it with LANCZOS, as the app did on every resize before the caches;
+"disk cache" reads a size scaled in an earlier session; "draft" is the quarter-scale decode shown during a drag.
+The app's own GymManagerApp methods run on a stand-in holding only the attributes they use.
+
+    python benchmarks/background.py --sizes 1280x720 1920x1080 --repeat 20
+
+Needs Pillow. The disk cache is read with Tk's PNG reader when a display is available, otherwise with Pillow.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from threading import Lock
+
+from harness import ROOT, load_gym_manager, report, summary, timed
+
+class BackgroundImage:
+    """The part of GymManagerApp the background methods use, starting with nothing loaded or cached."""
+
+    def __init__(self, gym, path, cache_dir):
+        self.app_class = gym.GymManagerApp
+        self.background_path = path
+        self.image_cache_dir = cache_dir
+        self.image = None
+        self.preview = None
+        self.image_lock = Lock()
+        self.IMAGE_CACHE_SIZE = 6
+
+    def __getattr__(self, name):
+        return getattr(self.app_class, name).__get__(self)
+
+def window_size(text):
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+def png_reader():
+    """Returns a function that reads a cached PNG the way the app would here, and a label for it."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        return lambda path: tk.PhotoImage(master=root, file=path), "Tk PhotoImage"
+    except tk.TclError:
+        from PIL import Image
+        return lambda path: Image.open(path).load(), "Pillow, no display"
+
+def benchmark_background(argv):
+    gym = load_gym_manager()
+    parser = argparse.ArgumentParser(prog="benchmarks/background.py",
+        description="Measure background load and scale times from cold and from the caches.")
+    parser.add_argument("--image", default=os.path.join(ROOT, "background.jpg"))
+    parser.add_argument("--sizes", type=window_size, nargs="+", default=[(1280, 720), (1920, 1080)])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    read_png, reader_label = png_reader()
+    cache_dir = tempfile.mkdtemp(prefix="gym-background-benchmark-")
+    try:
+        for width, height in args.sizes:
+            label = f"{width}x{height}"
+
+            def cold():
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                BackgroundImage(gym, args.image, cache_dir).scaled_background(width, height)
+
+            def draft_cold():
+                BackgroundImage(gym, args.image, cache_dir).draft_background(width, height)
+
+            warm = BackgroundImage(gym, args.image, cache_dir)
+            warm.draft_background(width, height)
+            cache_path = warm.background_cache_path(width, height)
+
+            cold_samples = timed(cold, args.repeat)
+            warm_samples = timed(warm.scaled_background, args.repeat, width, height)
+            disk_samples = timed(read_png, args.repeat, cache_path)
+            report(f"{label:>9}  cold: decode, LANCZOS, save", cold_samples)
+            report(f"{label:>9}  decoded: LANCZOS, save", warm_samples)
+            report(f"{label:>9}  disk cache ({reader_label})", disk_samples)
+            report(f"{label:>9}  draft, cold", timed(draft_cold, args.repeat))
+            report(f"{label:>9}  draft, decoded", timed(warm.draft_background, args.repeat, width, height))
+            print(f"{label:>9}  disk cache {summary(cold_samples)[0] / summary(disk_samples)[0]:.0f}x faster than cold")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_background(sys.argv[1:]))
@@ -0,0 +1,122 @@
+"""Measures read and write latency through GymDatabase against a connection per call, alone and concurrently.
+
+"before" opens a new sqlite3 connection for every call on a rollback-journal copy of the database, as the app
+did before GymDatabase. "after" writes through the shared WAL connection and reads through per-thread readers.
+
+    python benchmarks/database.py --members 100000 --seconds 3 --readers 2
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from threading import Event, Thread
+
+from harness import load_gym_manager, open_database, report, timed
+
+PAGE_QUERY = """ SELECT id, name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status FROM members WHERE (date_of_activation, id) > ('2024-01-01', 0) ORDER BY date_of_activation, id LIMIT 100 """
+WRITE_QUERY = " UPDATE app_data SET message_count = message_count + 1 "
+
+class PerCallConnections:
+    """The access pattern before GymDatabase: connect, run one statement, commit and close."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def read(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute(PAGE_QUERY).fetchall()
+        finally:
+            conn.close()
+
+    def write(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute(WRITE_QUERY)
+            conn.commit()
+        finally:
+            conn.close()
+
+class SharedConnection:
+    """GymDatabase: one tuned connection for writes and a read-only connection per reading thread."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def read(self):
+        self.db.reader().execute(PAGE_QUERY).fetchall()
+
+    def write(self):
+        with self.db.transaction() as cursor:
+            cursor.execute(WRITE_QUERY)
+
+def concurrent(access, seconds, readers, write_interval):
+    """Runs reader threads flat out while one thread writes every write_interval seconds; returns both latencies."""
+    stop = Event()
+    read_samples, write_samples = [], []
+
+    def read_loop():
+        samples = []
+        while not stop.is_set():
+            samples.extend(timed(access.read, 1))
+        read_samples.extend(samples)
+
+    def write_loop():
+        while not stop.is_set():
+            write_samples.extend(timed(access.write, 1))
+            stop.wait(write_interval)
+
+    threads = [Thread(target=read_loop) for _ in range(readers)] + [Thread(target=write_loop)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return read_samples, write_samples
+
+def rollback_journal_copy(db, path):
+    """Copies the seeded database to path and switches the copy back to the default rollback journal."""
+    if os.path.exists(path):
+        os.remove(path)
+    copy = sqlite3.connect(path)
+    db.conn.backup(copy)
+    copy.execute("PRAGMA journal_mode = DELETE")
+    copy.close()
+
+def benchmark_database(argv):
+    gym = load_gym_manager()
+    parser = argparse.ArgumentParser(prog="benchmarks/database.py",
+        description="Measure read and write latency with a connection per call and with the shared WAL connection.")
+    parser.add_argument("--members", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=3, help="length of the concurrent run")
+    parser.add_argument("--readers", type=int, default=2, help="reading threads in the concurrent run")
+    parser.add_argument("--write-interval-ms", type=float, default=5)
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "gym-database-benchmark-{members}.db"))
+    args = parser.parse_args(argv)
+
+    path = args.database.format(members=args.members)
+    before_path = f"{path}.rollback"
+    db = open_database(gym, path, args.members)
+    try:
+        with db.transaction() as cursor:
+            cursor.execute(" INSERT INTO app_data (message_count) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM app_data) ")
+        rollback_journal_copy(db, before_path)
+
+        for label, access in (("before", PerCallConnections(before_path)), ("after", SharedConnection(db))):
+            report(f"{label:<6}  read page", timed(access.read, args.repeat))
+            report(f"{label:<6}  write", timed(access.write, args.repeat))
+            reads, writes = concurrent(access, args.seconds, args.readers, args.write_interval_ms / 1000)
+            report(f"{label:<6}  read page, while writing ({len(reads)})", reads)
+            report(f"{label:<6}  write, while reading ({len(writes)})", writes)
+    finally:
+        db.close()
+        if os.path.exists(before_path):
+            os.remove(before_path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_database(sys.argv[1:]))
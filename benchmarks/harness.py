@@ -0,0 +1,78 @@
+"""Helpers shared by the benchmark scripts: loading the app, seeding a members table and reporting timings."""
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_NAMES = ("Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Deepak", "Divya", "Gaurav", "Ishaan", "Jyoti", "Kavya",
+    "Kiran", "Manish", "Meera", "Neha", "Nikhil", "Pooja", "Pradeep", "Priya", "Rahul", "Rajesh", "Ramesh", "Ravi",
+    "Rohan", "Sanjay", "Sneha", "Suresh", "Tanvi", "Varun", "Vikram")
+LAST_NAMES = ("Agarwal", "Bhat", "Chopra", "Das", "Desai", "Gupta", "Iyer", "Jain", "Joshi", "Kapoor", "Khan", "Kumar",
+    "Mehta", "Menon", "Mishra", "Nair", "Patel", "Pillai", "Rao", "Reddy", "Sharma", "Shetty", "Singh", "Verma")
+
+def load_gym_manager():
+    """Imports GYM-MANAGER.py, whose file name is not a valid module name."""
+    if "gym_manager" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("gym_manager", os.path.join(ROOT, "GYM-MANAGER.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["gym_manager"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["gym_manager"]
+
+def member_rows(gym, count, seed=1, years=5):
+    """Yields count members activated over the last `years` years, with the status the expiry sweep would give them."""
+    rng = random.Random(seed)
+    today = date.today()
+    first_day = today - timedelta(days=365 * years)
+    for i in range(count):
+        months = rng.choice((1, 1, 1, 3, 6, 12))
+        activated = (first_day + timedelta(days=rng.randrange(365 * years))).isoformat()
+        expires = gym.add_months(activated, months)
+        active = expires >= today.isoformat()
+        yield (f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", rng.randrange(16, 70), rng.choice(("Male", "Female")),
+            f"9{i:09d}", "1 month" if months == 1 else f"{months} month's", rng.choice((80000, 150000, 399950)),
+            rng.choice(("Cash", "Online")), activated, expires, "Active" if active else "Inactive",
+            "True" if active or rng.random() < 0.5 else "False")
+
+def seed_members(gym, db, count, seed=1, batch=50000):
+    """Inserts count generated members in batches through the app's own schema, triggers and indexes."""
+    rows = member_rows(gym, count, seed)
+    started = time.perf_counter()
+    for start in range(0, count, batch):
+        with db.transaction() as cursor:
+            cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status, notified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) """,
+                (next(rows) for _ in range(min(batch, count - start))))
+    print(f"seeded {count} members in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+def open_database(gym, path, members, seed=1):
+    """Opens a migrated app database at path, seeding it with members first if it does not exist yet."""
+    fresh = not os.path.exists(path)
+    db = gym.GymDatabase(path)
+    db.init_schema()
+    db.migrate()
+    if fresh:
+        seed_members(gym, db, members, seed)
+    return db
+
+def timed(func, repeat, *args):
+    """Calls func(*args) repeat times and returns the wall-clock seconds of each call."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+def summary(samples):
+    """Returns (p50, p95, max) of samples in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return cuts[49] * 1000, cuts[94] * 1000, max(samples) * 1000
+
+def report(label, samples):
+    p50, p95, worst = summary(samples)
+    print(f"{label:<44} p50 {p50:8.2f} ms   p95 {p95:8.2f} ms   max {worst:8.2f} ms")
@@ -0,0 +1,228 @@
+"""Measures the alert pipeline end to end against a local stub gateway.
+
+Press-Alert queueing (GymManagerApp.send_whatsapp_message), the outbox, the dispatcher and the HTTP
+transport all run for real on a temporary database; only the Tk root is replaced by a headless loop.
+
+    python benchmarks/outbox.py --messages 1000 --concurrency 8 --latency-ms 20 --failure-rate 0.1
+"""
+import argparse
+import heapq
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import types
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_gym_manager():
+    """Imports GYM-MANAGER.py, whose file name is not a valid module name."""
+    if "gym_manager" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("gym_manager", os.path.join(ROOT, "GYM-MANAGER.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["gym_manager"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["gym_manager"]
+
+class StubGateway:
+    """A local HTTP messaging gateway that answers after a random delay and fails a share of requests."""
+
+    def __init__(self, latency=0.02, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = Lock()
+        self.received = 0
+        self.rejected = 0
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so the transport's pooled session reuses its connections, without Nagle delays on replies.
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                delay, fail = gateway.next_reply()
+                time.sleep(delay)
+                body = b'{"status": "unavailable"}' if fail else b'{"status": "sent"}'
+                self.send_response(503 if fail else 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}/messages"
+
+    def next_reply(self):
+        """Returns (delay, fail) for the next request: an exponentially distributed delay and a weighted coin flip."""
+        with self.lock:
+            self.received += 1
+            fail = self.random.random() < self.failure_rate
+            self.rejected += fail
+            return (self.random.expovariate(1 / self.latency) if self.latency else 0), fail
+
+    def start(self):
+        Thread(target=self.server.serve_forever, name="stub-gateway", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class HeadlessLoop:
+    """The after() scheduling subset of a Tk root, run without a display."""
+
+    def __init__(self):
+        self.timers = []
+        self.cancelled = set()
+        self.next_id = 0
+
+    def after(self, delay_ms, func, *args):
+        self.next_id += 1
+        heapq.heappush(self.timers, (time.monotonic() + delay_ms / 1000, self.next_id, func, args))
+        return self.next_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, timer_id):
+        self.cancelled.add(timer_id)
+
+    def report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        """Prints a failed callback's traceback, like Tk does."""
+        import traceback
+        traceback.print_exception(exc_type, exc_value, exc_traceback)
+
+    def run_until(self, done, timeout):
+        """Runs due callbacks until done() is true; returns False if timeout seconds pass first."""
+        deadline = time.monotonic() + timeout
+        while not done():
+            if time.monotonic() > deadline:
+                return False
+            due, timer_id, func, args = self.timers[0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(min(wait, 0.001))
+                continue
+            heapq.heappop(self.timers)
+            if timer_id in self.cancelled:
+                self.cancelled.discard(timer_id)
+                continue
+            func(*args)
+        return True
+
+def headless_app(gym, loop, db, args):
+    """A GymManagerApp without widgets: Gym Accounts is closed and message boxes are printed."""
+    app = object.__new__(gym.GymManagerApp)
+    app.root = loop
+    app.db = db
+    app.online = True
+    app.whatsapp_confirmed = False
+    app.license_limit_warned = False
+    app.transport = None
+    app.dispatcher = None
+    app.FREE_MESSAGE_LIMIT = 20
+    app.OUTBOX_MAX_ATTEMPTS = args.max_attempts
+    app.OUTBOX_BACKOFF_SECONDS = args.backoff
+    app.refresh_inactive_members = lambda month: None
+    return app
+
+def print_message(title, message):
+    print(f"{title}: {' '.join(message.split())}")
+
+def benchmark_outbox(argv):
+    """Queues alerts through the Alert button's code path and drains them into a StubGateway, then reports on it."""
+    gym = load_gym_manager()
+
+    parser = argparse.ArgumentParser(prog="benchmarks/outbox.py",
+        description="Measure notification throughput, send latency and retry handling against a local stub gateway.")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=gym.HttpApiTransport.concurrency)
+    parser.add_argument("--per-minute", type=int, default=60000)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=0.05, help="seconds before the first retry")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args(argv)
+
+    # The app's message boxes would need a display; the benchmark prints them instead.
+    messagebox = gym.messagebox
+    gym.messagebox = types.SimpleNamespace(showinfo=print_message, showwarning=print_message, showerror=print_message)
+
+    latencies = []
+    send = gym.HttpApiTransport.send
+
+    def timed_send(transport, phone_number, message):
+        started = time.perf_counter()
+        try:
+            send(transport, phone_number, message)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    gym.HttpApiTransport.send = timed_send
+
+    gateway = StubGateway(args.latency_ms / 1000, args.failure_rate, seed=1).start()
+    with tempfile.TemporaryDirectory() as directory:
+        db = gym.GymDatabase(os.path.join(directory, "benchmark.db"))
+        try:
+            db.init_schema()
+            db.migrate()
+            expired_on = date.today() - timedelta(days=1)
+            with db.transaction() as cursor:
+                cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status, notified) VALUES (?, 30, 'Male', ?, '1 month', 100000, 'Cash', ?, ?, 'Inactive', 'False') """,
+                ((f"Member {i}", f"9{i:09d}", gym.add_months(expired_on.isoformat(), -1), expired_on.isoformat())
+                    for i in range(args.messages)))
+
+            loop = HeadlessLoop()
+            app = headless_app(gym, loop, db, args)
+            app.save_app_data(license_key_expiration="31-12-2099")
+            with db.transaction() as cursor:
+                cursor.execute(" UPDATE app_data SET transport = 'http', transport_url = ?, transport_concurrency = ?, transport_per_minute = ? ",
+                    (gateway.url, args.concurrency, args.per_minute))
+            app.start_dispatcher()
+            if app.dispatcher is None:
+                return 1
+            app.inactive_month = "This Month"
+            app.inactive_month_range = gym.month_bounds(expired_on)
+
+            started = time.perf_counter()
+            app.send_whatsapp_message()
+            drained = loop.run_until(lambda: not app.dispatcher.busy() and db.next_notification_due() is None, args.timeout)
+            elapsed = time.perf_counter() - started
+            app.dispatcher.shutdown()
+
+            with db.transaction() as cursor:
+                cursor.execute(" SELECT COALESCE(SUM(status = 'sent'), 0), COALESCE(SUM(status = 'failed'), 0), COALESCE(SUM(attempts), 0) FROM outbox ")
+                sent, failed, attempts = cursor.fetchone()
+        finally:
+            gym.HttpApiTransport.send = send
+            gym.messagebox = messagebox
+            db.close()
+            gateway.stop()
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    print(f"messages:   {args.messages} queued, {sent} sent, {failed} failed, {attempts - args.messages} retries")
+    print(f"gateway:    {gateway.received} requests, {gateway.rejected} answered 503")
+    print(f"throughput: {sent / elapsed:.1f} messages/s over {elapsed:.2f} s"
+        f" (concurrency {args.concurrency}, limit {args.per_minute}/min)")
+    print(f"send time:  p50 {percentiles[49] * 1000:.1f} ms, p95 {percentiles[94] * 1000:.1f} ms,"
+        f" p99 {percentiles[98] * 1000:.1f} ms, max {max(latencies, default=0) * 1000:.1f} ms")
+    if not drained:
+        print(f"timed out after {args.timeout:.0f} s with messages still queued")
+    return 0 if drained and sent + failed == args.messages else 1
+
+if __name__ == "__main__":
+    sys.exit(benchmark_outbox(sys.argv[1:]))
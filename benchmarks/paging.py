@@ -0,0 +1,163 @@
+"""Measures the member table scrolled from the first member to the last and back, a screen at a time.
+
+The app's own paging methods run on a stand-in holding only the attributes they use; the Treeview is replaced by
+a list of items with their display values, so the item count is what Tk would hold. "window" is the fixed window
+of MEMBER_WINDOW_PAGES pages; "load-more" keeps every page once loaded, as the table did before.
+
+    python benchmarks/paging.py --members 1000 10000 100000 1000000
+
+Memory is the peak traced by tracemalloc over a second, untimed pass, so it counts Python objects only.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from threading import Event
+
+from harness import load_gym_manager, open_database, report, timed
+
+class MemberTree:
+    """Stands in for the member Treeview: top-level items in order, their values and the fraction in view."""
+
+    def __init__(self, screen_rows):
+        self.screen_rows = screen_rows
+        self.items = []
+        self.values = {}
+        self.first = 0.0
+
+    def insert(self, parent, index, iid=None, values=()):
+        self.items.insert(len(self.items) if index == "end" else index, iid)
+        self.values[iid] = tuple(values)
+        return iid
+
+    def item(self, iid, values=None):
+        self.values[iid] = tuple(values)
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.items.remove(iid)
+            del self.values[iid]
+
+    def move(self, iid, parent, index):
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+
+    def index(self, iid):
+        return self.items.index(iid)
+
+    def get_children(self, item=""):
+        return tuple(self.items)
+
+    def yview(self, *args):
+        return self.first, min(self.first + self.screen_rows / max(len(self.items), 1), 1.0)
+
+    def yview_moveto(self, fraction):
+        self.first = fraction
+
+class IdleQueue:
+    """Stands in for the Tk root: after_idle callbacks wait until run() is called."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after_idle(self, func, *args):
+        self.callbacks.append((func, args))
+
+    def run(self):
+        while self.callbacks:
+            func, args = self.callbacks.pop(0)
+            func(*args)
+
+class AllMonths:
+    def get(self):
+        return "No Data Available"
+
+class Scrollbar:
+    def set(self, first, last):
+        pass
+
+class MemberTable:
+    """The part of GymManagerApp the member table's paging uses, on db with no month selected."""
+
+    def __init__(self, gym, db, screen_rows, window_pages):
+        self.app_class = gym.GymManagerApp
+        self.db = db
+        self.root = IdleQueue()
+        self.tree = MemberTree(screen_rows)
+        self.member_scrollbar = Scrollbar()
+        self.selected_month = AllMonths()
+        self.search_after_id = None
+        self.search_cancelled = Event()
+        self.search_generation = 0
+        self.member_rows = {}
+        self.member_keys = []
+        self.MEMBER_PAGE_SIZE = 100
+        self.MEMBER_WINDOW_PAGES = window_pages
+        self.MEMBER_PREFETCH_FRACTION = 0.8
+
+    def __getattr__(self, name):
+        return getattr(self.app_class, name).__get__(self)
+
+    def scroll(self, rows):
+        """Scrolls the view by rows, as the scrollbar would, and runs the page loads it queues."""
+        total = len(self.tree.items)
+        top = min(max(round(self.tree.first * total) + rows, 0), max(total - self.tree.screen_rows, 0))
+        self.tree.first = top / total
+        self.on_member_tree_scroll(*self.tree.yview())
+        self.root.run()
+
+    def at_bottom(self):
+        return self.member_pages_done and round(self.tree.first * len(self.tree.items)) + self.tree.screen_rows >= len(self.tree.items)
+
+    def at_top(self):
+        return self.member_window_start == ("", 0) and round(self.tree.first * len(self.tree.items)) == 0
+
+def scroll_through(table, down=None, up=None):
+    """Scrolls from the top to the bottom and back a screen at a time; returns the most items the table held.
+
+    Step timings are appended to down and up when they are given.
+    """
+    table.populate_treeview()
+    most_items = 0
+    for rows, done, samples in ((table.tree.screen_rows, table.at_bottom, down), (-table.tree.screen_rows, table.at_top, up)):
+        while not done():
+            if samples is None:
+                table.scroll(rows)
+            else:
+                samples.extend(timed(table.scroll, 1, rows))
+            most_items = max(most_items, len(table.tree.items))
+    return most_items
+
+def benchmark_paging(argv):
+    gym = load_gym_manager()
+    parser = argparse.ArgumentParser(prog="benchmarks/paging.py",
+        description="Measure member table memory and scroll latency with the fixed window and with load-more paging.")
+    parser.add_argument("--members", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--screen-rows", type=int, default=20, help="rows scrolled per step, about one screen")
+    parser.add_argument("--load-more-max", type=int, default=100000,
+        help="largest table to measure load-more paging on; it holds every member in memory")
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "gym-paging-benchmark-{members}.db"))
+    args = parser.parse_args(argv)
+
+    for members in args.members:
+        db = open_database(gym, args.database.format(members=members), members)
+        try:
+            modes = [("window", 3)] + ([("load-more", sys.maxsize)] if members <= args.load_more_max else [])
+            for label, window_pages in modes:
+                down, up = [], []
+                most_items = scroll_through(MemberTable(gym, db, args.screen_rows, window_pages), down, up)
+                report(f"{members:>8}  {label:<9}  scroll down a screen", down)
+                report(f"{members:>8}  {label:<9}  scroll up a screen", up)
+
+                tracemalloc.start()
+                scroll_through(MemberTable(gym, db, args.screen_rows, window_pages))
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{members:>8}  {label:<9}  most items in the table {most_items}, peak memory {peak / 2**20:.1f} MiB")
+        finally:
+            db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_paging(sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""Measures member name search on a large seeded database: the FTS5 trigram path against the LIKE scan it replaced.
+
+    python benchmarks/search.py --members 1000000 --repeat 50
+
+The database is kept at --database between runs, since seeding a million members takes a while.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from harness import load_gym_manager, open_database, report, summary, timed
+
+QUERIES = (
+    ("one term, common", "ram"),
+    ("one term, rare", "pillai"),
+    ("two phrases", "priya sharma"),
+    ("phrase and short word", "kumar ra"),
+)
+
+def like_scan(db, query):
+    """The search before the FTS index: every word as LIKE '%word%' over the whole table, all matches fetched."""
+    words = query.split()
+    conn = db.reader()
+    return conn.execute(f""" SELECT {db.MEMBER_COLUMNS} FROM members WHERE {" AND ".join("name LIKE ?" for _ in words)} """,
+        [f"%{word}%" for word in words]).fetchall()
+
+def benchmark_search(argv):
+    gym = load_gym_manager()
+    parser = argparse.ArgumentParser(prog="benchmarks/search.py", description="Measure member search latency.")
+    parser.add_argument("--members", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100, help="result limit, as SEARCH_RESULT_LIMIT in the app")
+    parser.add_argument("--budget-ms", type=float, default=10, help="p95 each FTS query must stay under")
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "gym-search-benchmark-{members}.db"))
+    args = parser.parse_args(argv)
+
+    db = open_database(gym, args.database.format(members=args.members), args.members)
+    try:
+        with db.transaction() as cursor:
+            if not db.has_name_search(cursor):
+                print("this SQLite build has no FTS5 trigram tokenizer; the app falls back to LIKE", file=sys.stderr)
+                return 1
+
+        over_budget = []
+        for label, query in QUERIES:
+            matches = len(db.find_members(query, args.limit))
+            samples = timed(db.find_members, args.repeat, query, args.limit)
+            report(f"FTS   {label} ({matches})", samples)
+            report(f"LIKE  {label}", timed(like_scan, max(args.repeat // 10, 2), db, query))
+            if summary(samples)[1] > args.budget_ms:
+                over_budget.append(query)
+    finally:
+        db.close()
+
+    if over_budget:
+        print(f"over the {args.budget_ms:g} ms p95 budget at {args.members} members: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_search(sys.argv[1:]))
@@ -0,0 +1,92 @@
+"""Measures the Gym Accounts figures read from the monthly_stats rollup against aggregating the members table.
+
+Also measures what the rollup costs: member writes with its triggers against a copy without them.
+
+    python benchmarks/stats.py --members 10000 100000 1000000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import date
+
+from harness import load_gym_manager, member_rows, open_database, report, summary, timed
+
+def rollup_figures(conn, first_day, last_day):
+    """What Gym Accounts reads now: one row of monthly_stats and the member_totals counter."""
+    conn.execute(" SELECT month FROM monthly_stats WHERE new_members > 0 ORDER BY month DESC ").fetchall()
+    conn.execute(""" SELECT COALESCE(s.new_members, 0), COALESCE(s.revenue_cash_paise + s.revenue_online_paise, 0), t.active_members, COALESCE(s.inactive_notified + s.inactive_unnotified, 0) FROM member_totals t LEFT JOIN monthly_stats s ON s.month = ? """, (first_day[:7],)).fetchone()
+    conn.execute(" SELECT inactive_notified, inactive_unnotified FROM monthly_stats WHERE month = ? ", (first_day[:7],)).fetchone()
+
+def aggregate_figures(conn, first_day, last_day):
+    """The same figures aggregated from members on every read, through the indexes the table has."""
+    conn.execute(" SELECT DISTINCT substr(date_of_activation, 1, 7) FROM members ORDER BY 1 DESC ").fetchall()
+    conn.execute(" SELECT COUNT(*), COALESCE(SUM(fees_paise), 0) FROM members WHERE date_of_activation >= ? AND date_of_activation < ? ", (first_day, last_day)).fetchone()
+    conn.execute(" SELECT COUNT(*) FROM members WHERE status = 'Active' ").fetchone()
+    conn.execute(" SELECT SUM(notified = 'True'), SUM(notified = 'False') FROM members WHERE status = 'Inactive' AND expiration_date >= ? AND expiration_date < ? ", (first_day, last_day)).fetchone()
+
+def copy_without_rollup(db, path):
+    """Copies the database to path and drops the triggers that keep monthly_stats and member_totals current."""
+    if os.path.exists(path):
+        os.remove(path)
+    copy = sqlite3.connect(path)
+    db.conn.backup(copy)
+    triggers = [row[0] for row in copy.execute(" SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'members_stats%' ")]
+    for trigger in triggers:
+        copy.execute(f" DROP TRIGGER {trigger} ")
+    copy.commit()
+    return copy
+
+def write_members(conn, rows):
+    """Inserts rows, renews them and deletes them again in one transaction that is rolled back."""
+    conn.execute("BEGIN")
+    try:
+        first_id = conn.execute(" SELECT COALESCE(MAX(id), 0) + 1 FROM members ").fetchone()[0]
+        conn.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status, notified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) """, rows)
+        conn.execute(" UPDATE members SET status = 'Inactive', notified = 'False' WHERE id >= ? ", (first_id,))
+        conn.execute(" DELETE FROM members WHERE id >= ? ", (first_id,))
+    finally:
+        conn.rollback()
+
+def benchmark_stats(argv):
+    gym = load_gym_manager()
+    parser = argparse.ArgumentParser(prog="benchmarks/stats.py",
+        description="Compare the monthly_stats rollup with aggregating members on every read.")
+    parser.add_argument("--members", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--writes", type=int, default=1000, help="members written per write sample")
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "gym-stats-benchmark-{members}.db"))
+    args = parser.parse_args(argv)
+
+    first_day, last_day = gym.month_bounds(date.today())
+    for members in args.members:
+        path = args.database.format(members=members)
+        plain_path = f"{path}.plain"
+        db = open_database(gym, path, members)
+        try:
+            conn = db.reader()
+            rollup = timed(rollup_figures, args.repeat, conn, first_day, last_day)
+            aggregate = timed(aggregate_figures, args.repeat, conn, first_day, last_day)
+            report(f"{members:>8}  read, rollup", rollup)
+            report(f"{members:>8}  read, aggregate", aggregate)
+
+            rows = list(member_rows(gym, args.writes, seed=2))
+            plain = copy_without_rollup(db, plain_path)
+            try:
+                with_triggers = timed(write_members, max(args.repeat // 4, 2), db.conn, rows)
+                without_triggers = timed(write_members, max(args.repeat // 4, 2), plain, rows)
+            finally:
+                plain.close()
+            report(f"{members:>8}  write {args.writes}, with rollup", with_triggers)
+            report(f"{members:>8}  write {args.writes}, without rollup", without_triggers)
+            print(f"{members:>8}  reads {summary(aggregate)[0] / summary(rollup)[0]:.0f}x faster, "
+                f"writes {summary(with_triggers)[0] / summary(without_triggers)[0]:.1f}x slower")
+        finally:
+            db.close()
+            if os.path.exists(plain_path):
+                os.remove(plain_path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_stats(sys.argv[1:]))
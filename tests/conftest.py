@@ -0,0 +1,255 @@
+import heapq
+import importlib.util
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_script(name, file_name):
+    """Imports one of the repo's scripts, whose file names are not valid module names."""
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, file_name))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+class HeadlessLoop:
+    """The subset of a Tk root GymManagerApp uses, run without a display; failed callbacks are collected."""
+
+    def __init__(self):
+        self.timers = []
+        self.cancelled = set()
+        self.next_id = 0
+        self.reported = []
+
+    def after(self, delay_ms, func, *args):
+        self.next_id += 1
+        heapq.heappush(self.timers, (time.monotonic() + delay_ms / 1000, self.next_id, func, args))
+        return self.next_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, timer_id):
+        self.cancelled.add(timer_id)
+
+    def report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        self.reported.append(exc_value)
+
+    def state(self, *args):
+        pass
+
+    def title(self, *args):
+        pass
+
+    def protocol(self, *args):
+        pass
+
+    def pending(self):
+        """Returns the callbacks scheduled and not cancelled, soonest first."""
+        return [func for due, timer_id, func, args in sorted(self.timers) if timer_id not in self.cancelled]
+
+    def run_idle(self):
+        """Runs the callbacks that are already due, as Tk would on its next idle pass."""
+        self.run_until(lambda: not self.timers or self.timers[0][0] > time.monotonic(), timeout=5)
+
+    def run_until(self, done, timeout):
+        """Runs due callbacks until done() is true; returns False if timeout seconds pass first."""
+        deadline = time.monotonic() + timeout
+        while not done():
+            if time.monotonic() > deadline or not self.timers:
+                return False
+            due, timer_id, func, args = self.timers[0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(min(wait, 0.001))
+                continue
+            heapq.heappop(self.timers)
+            if timer_id in self.cancelled:
+                self.cancelled.discard(timer_id)
+                continue
+            func(*args)
+        return True
+
+class Widget:
+    """Stands in for the Tk widgets GymManagerApp.setup_ui creates."""
+
+    def __init__(self, master=None, **options):
+        self.options = options
+        self.bindings = {}
+
+    def pack(self, **options):
+        pass
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def bind(self, sequence, func):
+        self.bindings[sequence] = func
+
+    def unbind(self, sequence):
+        self.bindings.pop(sequence, None)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_children(self):
+        return []
+
+class Field(Widget):
+    """Stands in for an Entry, a DateEntry or a StringVar holding value."""
+
+    def __init__(self, value="", **options):
+        super().__init__(**options)
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def get_date(self):
+        return self.value
+
+    def destroy(self):
+        pass
+
+class Tree(Widget):
+    """Stands in for a ttk.Treeview holding top-level items only, in order."""
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.items = []
+        self.values = {}
+        self.selected = ()
+        self.view = (0.0, 1.0)
+
+    def insert(self, parent, index, iid=None, values=()):
+        iid = iid if iid is not None else f"I{len(self.values) + 1:03d}"
+        self.items.insert(len(self.items) if index == "end" else index, iid)
+        self.values[iid] = tuple(values)
+        return iid
+
+    def item(self, iid, values=None):
+        if values is None:
+            return {"values": list(self.values[iid])}
+        self.values[iid] = tuple(values)
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.items.remove(iid)
+            del self.values[iid]
+        self.selected = tuple(iid for iid in self.selected if iid in self.values)
+
+    def move(self, iid, parent, index):
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+
+    def index(self, iid):
+        return self.items.index(iid)
+
+    def exists(self, iid):
+        return iid in self.values
+
+    def get_children(self, item=""):
+        return tuple(self.items)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, *iids):
+        self.selected = tuple(iids)
+
+    def yview(self, *args):
+        return self.view
+
+    def yview_moveto(self, fraction):
+        self.view = (fraction, self.view[1])
+
+class Dialogs:
+    """Stands in for tkinter.messagebox: records every box as (kind, title) and answers questions from answers."""
+
+    def __init__(self):
+        self.shown = []
+        self.answers = []
+
+    def show(self, kind, title):
+        self.shown.append((kind, title))
+
+    def showinfo(self, title, message):
+        self.show("info", title)
+
+    def showwarning(self, title, message):
+        self.show("warning", title)
+
+    def showerror(self, title, message):
+        self.show("error", title)
+
+    def askyesno(self, title, message):
+        self.show("question", title)
+        return self.answers.pop(0)
+
+    def titles(self, kind):
+        return [title for shown_kind, title in self.shown if shown_kind == kind]
+
+@pytest.fixture(scope="session")
+def gym():
+    return load_script("gym_manager", "GYM-MANAGER.py")
+
+@pytest.fixture(scope="session")
+def outbox_benchmark(gym):
+    return load_script("outbox_benchmark", os.path.join("benchmarks", "outbox.py"))
+
+@pytest.fixture(scope="session")
+def benchmark_script(gym):
+    """Returns a loader for the scripts in benchmarks/, which import their shared helpers from harness.py."""
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    return lambda name: load_script(f"{name}_benchmark", os.path.join("benchmarks", f"{name}.py"))
+
+@pytest.fixture(scope="session")
+def key_generator():
+    return load_script("license_key_generator", "LicenseKeyGenerator.py")
+
+@pytest.fixture
+def loop():
+    return HeadlessLoop()
+
+@pytest.fixture
+def dialogs(gym, monkeypatch):
+    dialogs = Dialogs()
+    monkeypatch.setattr(gym, "messagebox", dialogs)
+    return dialogs
+
+@pytest.fixture
+def headless_app(gym, loop, dialogs, tmp_path, monkeypatch):
+    """A GymManagerApp built by its own __init__ on a migrated temporary database.
+
+    Widgets are stand-ins, and start-up maintenance, the sidebar and the connectivity probe do not run.
+    """
+    database_class = gym.GymDatabase
+
+    class TemporaryDatabase(database_class):
+        def __init__(self, path):
+            super().__init__(str(tmp_path / "gym.db"))
+
+    monkeypatch.setattr(gym, "GymDatabase", TemporaryDatabase)
+    monkeypatch.setattr(gym.tk, "Label", Widget)
+    for name in ("create_buttons", "start_maintenance", "watch_connectivity"):
+        monkeypatch.setattr(gym.GymManagerApp, name, lambda self: None)
+
+    app = gym.GymManagerApp(loop)
+    app.db_path = str(tmp_path / "gym.db")
+    app.image_cache_dir = str(tmp_path / "image_cache")
+    app.db.init_schema()
+    app.db.migrate()
+    yield app
+    app.tasks.shutdown()
+    app.license_feed.close()
+    app.db.close()
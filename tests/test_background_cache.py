@@ -0,0 +1,45 @@
+import types
+
+import pytest
+
+@pytest.fixture
+def background_app(gym, headless_app, tmp_path, monkeypatch):
+    headless_app.background_path = str(tmp_path / "background.jpg")
+    headless_app.drafts = []
+    headless_app.request_background_draft = lambda: headless_app.drafts.append(headless_app.background_size)
+    monkeypatch.setattr(gym.tk, "PhotoImage", lambda file: ("photo", file))
+    (tmp_path / "background.jpg").write_bytes(b"jpeg")
+    return headless_app
+
+def resize(app, width, height):
+    app.on_background_configure(types.SimpleNamespace(width=width, height=height))
+
+def test_disk_cache_hit_skips_the_draft(background_app, tmp_path):
+    cache_path = background_app.background_cache_path(800, 600)
+    (tmp_path / "image_cache").mkdir()
+    open(cache_path, "wb").close()
+
+    resize(background_app, 800, 600)
+    assert background_app.drafts == []
+    assert background_app.background_after_id is None
+    assert background_app.photo == ("photo", cache_path)
+    assert background_app.background_photos[(800, 600)] == ("photo", cache_path)
+
+def test_cache_miss_drafts_then_settles(background_app, loop):
+    resize(background_app, 800, 600)
+    assert background_app.drafts == [(800, 600)]
+    assert background_app.load_and_resize_image in loop.pending()
+
+def test_missing_background_keeps_a_plain_window(gym, headless_app, tmp_path, monkeypatch):
+    monkeypatch.setattr(gym, "resource_path", lambda name: str(tmp_path / name))
+    headless_app.setup_ui()
+    assert headless_app.background_image.bindings == {}
+
+def test_a_background_error_is_reported_once(background_app, loop, dialogs):
+    resize(background_app, 800, 600)
+    assert "<Configure>" in background_app.background_image.bindings
+
+    background_app.show_background_error(FileNotFoundError("background.jpg"))
+    assert dialogs.titles("error") == ["Image Load Error"]
+    assert background_app.background_image.bindings == {}
+    assert background_app.load_and_resize_image not in loop.pending()
@@ -0,0 +1,42 @@
+def run_jobs(gym, loop, jobs):
+    """Submits (func, on_done, on_error) jobs to a BackgroundTasks polled by the headless loop."""
+    tasks = gym.BackgroundTasks(loop, poll_interval=1)
+    for func, on_done, on_error in jobs:
+        tasks.submit(func, on_done=on_done, on_error=on_error)
+    return tasks
+
+def test_results_are_delivered_after_a_callback_raises(gym, loop):
+    delivered = []
+
+    def broken_callback(result):
+        raise RuntimeError("callback failed")
+
+    def failing_job():
+        raise ValueError("job failed")
+
+    tasks = run_jobs(gym, loop, [
+        (lambda: 1, broken_callback, None),
+        (failing_job, None, broken_callback),
+        (lambda: 2, delivered.append, None),
+    ])
+    try:
+        assert loop.run_until(lambda: delivered and len(loop.reported) == 2, timeout=5)
+    finally:
+        tasks.shutdown()
+
+    assert delivered == [2]
+    assert [str(error) for error in loop.reported] == ["callback failed", "callback failed"]
+
+def test_the_poll_keeps_running_after_a_callback_raises(gym, loop):
+    delivered = []
+
+    def broken_callback(result):
+        raise RuntimeError("callback failed")
+
+    tasks = run_jobs(gym, loop, [(lambda: 1, broken_callback, None)])
+    try:
+        assert loop.run_until(lambda: loop.reported, timeout=5)
+        tasks.submit(lambda: 2, on_done=delivered.append)
+        assert loop.run_until(lambda: delivered, timeout=5)
+    finally:
+        tasks.shutdown()
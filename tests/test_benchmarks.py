@@ -0,0 +1,35 @@
+"""Small runs of the benchmark scripts, so they keep working as the app changes."""
+import pytest
+
+def run(benchmark_script, name, tmp_path, *args):
+    script = benchmark_script(name)
+    return getattr(script, f"benchmark_{name}")([*args, "--database", str(tmp_path / "{members}.db")])
+
+def test_search(benchmark_script, tmp_path, capsys):
+    assert run(benchmark_script, "search", tmp_path, "--members", "2000", "--repeat", "3", "--budget-ms", "10000") == 0
+    assert "FTS   two phrases" in capsys.readouterr().out
+
+def test_database(benchmark_script, tmp_path, capsys):
+    assert run(benchmark_script, "database", tmp_path, "--members", "2000", "--repeat", "3", "--seconds", "0.2") == 0
+    output = capsys.readouterr().out
+    assert "after   read page, while writing" in output
+    assert not (tmp_path / "2000.db.rollback").exists()
+
+def test_stats(benchmark_script, tmp_path, capsys):
+    assert run(benchmark_script, "stats", tmp_path, "--members", "2000", "--repeat", "4", "--writes", "50") == 0
+    output = capsys.readouterr().out
+    assert "read, aggregate" in output and "writes" in output
+    assert not (tmp_path / "2000.db.plain").exists()
+
+def test_background(benchmark_script, capsys):
+    pytest.importorskip("PIL")
+    script = benchmark_script("background")
+    assert script.benchmark_background(["--sizes", "320x200", "--repeat", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "320x200  disk cache" in output and "draft, decoded" in output
+
+def test_paging(benchmark_script, tmp_path, capsys):
+    assert run(benchmark_script, "paging", tmp_path, "--members", "1000") == 0
+    output = capsys.readouterr().out
+    assert "window     most items in the table 300" in output
+    assert "load-more  most items in the table 1000" in output
@@ -0,0 +1,16 @@
+import pytest
+
+@pytest.mark.parametrize("fees_paise, shown", [(149950, "1499.50"), (150000, "1500"), (5, "0.05")])
+def test_fees_round_trip_through_the_entry(gym, fees_paise, shown):
+    assert gym.fees_input(fees_paise) == shown
+    assert gym.parse_fees(shown) == fees_paise
+    assert gym.parse_fees(gym.format_fees(fees_paise).replace("Rs", "")) == fees_paise
+
+@pytest.mark.parametrize("text, paise", [("1499.5", 149950), ("1499.", 149900), ("", 0)])
+def test_partial_decimals_parse(gym, text, paise):
+    assert gym.parse_fees(text) == paise
+
+@pytest.mark.parametrize("text, valid", [("1499.50", True), ("1499.", True), ("", True), ("1499.505", False),
+    ("14.99.5", False), ("Rs 5", False)])
+def test_fees_entry_accepts_up_to_two_decimals(headless_app, text, valid):
+    assert headless_app.validate_input(text, "fees") == valid
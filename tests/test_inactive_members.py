@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from conftest import Tree, Widget
+
+class CountingTree(Tree):
+    inserts = 0
+
+    def insert(self, parent, index, iid=None, values=()):
+        self.inserts += 1
+        return super().insert(parent, index, iid, values)
+
+@pytest.fixture
+def inactive_view(gym, headless_app):
+    expired_on = date.today().replace(day=1).isoformat()
+    with headless_app.db.transaction() as cursor:
+        cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status, notified) VALUES (?, 30, 'Male', '9000000000', '1 month', 150000, 'Cash', ?, ?, 'Inactive', 'False') """,
+            [(f"Member {i}", gym.add_months(expired_on, -1), expired_on) for i in range(1, 4)])
+    headless_app.tree = CountingTree()
+    headless_app.top_frame = Widget()
+    headless_app.Notification_frame = Widget()
+    headless_app.inactive_rows = {}
+    headless_app.refresh_inactive_members("This Month")
+    return headless_app
+
+def test_an_outbox_refresh_keeps_the_selection_and_scroll_position(inactive_view):
+    tree = inactive_view.tree
+    assert tree.get_children() == ("1", "2", "3")
+    tree.selection_set("2")
+    tree.yview_moveto(0.5)
+
+    with inactive_view.db.transaction() as cursor:
+        cursor.execute(" UPDATE members SET notified = 'True' WHERE id = 1 ")
+        cursor.execute(" UPDATE members SET status = 'Active', expiration_date = '2099-01-01' WHERE id = 3 ")
+    inactive_view.on_outbox_change()
+
+    assert tree.get_children() == ("1", "2")
+    assert tree.selection() == ("2",)
+    assert tree.yview()[0] == 0.5
+    assert tree.inserts == 3
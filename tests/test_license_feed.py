@@ -0,0 +1,101 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+class FeedServer(ThreadingHTTPServer):
+    """Serves License_keys.csv with an ETag and Last-Modified, answering 304 when the client's copy is current."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FeedHandler)
+        self.body = "License Key,Expiration Date\nAAAA-1111-BBBB-2222,07-11-2026\n"
+        self.etag = '"v1"'
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/License_keys.csv"
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append((self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.server.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = self.server.body.encode()
+        self.send_response(200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Last-Modified", "Wed, 01 Oct 2026 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = FeedServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "license_feed.json")
+
+def test_first_fetch_downloads_and_parses_the_file(gym, server, cache_path):
+    feed = gym.LicenseFeed(server.url, cache_path, timeout=5)
+    assert feed.fetch() == {"AAAA-1111-BBBB-2222": "07-11-2026"}
+    assert server.requests == [(None, None)]
+    feed.close()
+
+def test_unchanged_file_is_answered_with_304(gym, server, cache_path):
+    feed = gym.LicenseFeed(server.url, cache_path, timeout=5)
+    first = feed.fetch()
+    assert feed.fetch() is first
+    assert server.requests[-1] == ('"v1"', "Wed, 01 Oct 2026 00:00:00 GMT")
+    feed.close()
+
+def test_changed_file_is_downloaded_again(gym, server, cache_path):
+    feed = gym.LicenseFeed(server.url, cache_path, timeout=5)
+    feed.fetch()
+    server.body += "CCCC-3333-DDDD-4444,01-01-2027\n"
+    server.etag = '"v2"'
+    assert feed.fetch() == {"AAAA-1111-BBBB-2222": "07-11-2026", "CCCC-3333-DDDD-4444": "01-01-2027"}
+    assert server.requests[-1][0] == '"v1"'
+    feed.close()
+
+def test_cache_is_reloaded_and_revalidated_by_a_new_instance(gym, server, cache_path):
+    gym.LicenseFeed(server.url, cache_path, timeout=5).fetch()
+
+    reloaded = gym.LicenseFeed(server.url, cache_path, timeout=5)
+    assert reloaded.cached() == {"AAAA-1111-BBBB-2222": "07-11-2026"}
+    assert len(server.requests) == 1
+
+    assert reloaded.fetch() == {"AAAA-1111-BBBB-2222": "07-11-2026"}
+    assert server.requests[-1][0] == '"v1"'
+    reloaded.close()
+
+def test_unreadable_cache_means_a_full_download(gym, server, cache_path):
+    with open(cache_path, "w") as file:
+        file.write("not json")
+    feed = gym.LicenseFeed(server.url, cache_path, timeout=5)
+    assert feed.cached() == {}
+    feed.fetch()
+    assert server.requests == [(None, None)]
+    feed.close()
+
+def test_file_without_the_expected_columns_is_rejected(gym):
+    with pytest.raises(gym.LicenseDataError):
+        gym.LicenseFeed.parse("Key,Date\nAAAA,01-01-2027\n")
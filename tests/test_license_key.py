@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+@pytest.fixture
+def license_app(headless_app):
+    headless_app.saved = []
+    headless_app.shown = []
+    headless_app.save_app_data = lambda **values: headless_app.saved.append(values)
+    headless_app.show_content = headless_app.shown.append
+    return headless_app
+
+def test_valid_key_is_saved(license_app):
+    expiration = (datetime.now() + timedelta(days=30)).strftime("%d-%m-%Y")
+    license_app.accept_license_key("AAAA-1111-BBBB-2222", expiration)
+    assert license_app.saved == [{"license_key_expiration": expiration, "license_key": "AAAA-1111-BBBB-2222"}]
+    assert license_app.shown == ["Gym Accounts"]
+
+def test_expired_key_is_refused(license_app, dialogs):
+    license_app.accept_license_key("AAAA-1111-BBBB-2222", "01-01-2020")
+    assert license_app.saved == []
+    assert dialogs.titles("error") == ["License Key Expired"]
+
+@pytest.mark.parametrize("value", ["REVOKED", "", "2027-01-01"])
+def test_a_feed_value_that_is_not_a_date_is_treated_as_revoked(license_app, dialogs, value):
+    license_app.accept_license_key("AAAA-1111-BBBB-2222", value)
+    assert license_app.saved == []
+    assert dialogs.titles("error") == ["License Key Revoked"]
@@ -0,0 +1,100 @@
+import csv
+import itertools
+import subprocess
+from datetime import date
+
+import pytest
+
+@pytest.fixture
+def registry(key_generator, tmp_path):
+    registry = key_generator.LicenseRegistry(str(tmp_path / "license_keys.db"))
+    yield registry
+    registry.close()
+
+def read_csv(path):
+    with open(path, newline="") as file:
+        return [(row["License Key"], row["Expiration Date"]) for row in csv.DictReader(file)]
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["License Key", "Expiration Date"])
+        writer.writerows(rows)
+
+def issue(registry, *keys):
+    keys = iter(keys)
+    with registry.transaction() as cursor:
+        return [registry.issue(cursor, lambda expiration_date: next(keys), date(2030, 1, 31), "Customer", "9000000000", 1, 800)
+            for _ in range(2)]
+
+def invoice_serials(issued):
+    return [int(invoice_number[-5:]) for _, invoice_number in issued]
+
+def test_invoice_numbers_have_no_gaps_across_batches_and_collisions(registry):
+    assert invoice_serials(issue(registry, "KEY-1", "KEY-2")) == [1, 2]
+    # The second batch draws a taken key first; the retry must not use up an invoice number.
+    assert invoice_serials(issue(registry, "KEY-1", "KEY-3", "KEY-4")) == [3, 4]
+
+def test_revoked_key_is_exported_as_revoked(registry, tmp_path):
+    issue(registry, "KEY-1", "KEY-2")
+    with registry.transaction() as cursor:
+        assert registry.revoke(cursor, "KEY-1")
+        assert not registry.revoke(cursor, "KEY-9")
+    registry.export_csv(str(tmp_path / "License_keys.csv"))
+    assert read_csv(tmp_path / "License_keys.csv") == [("KEY-1", "REVOKED"), ("KEY-2", "31-01-2030")]
+
+def test_csv_seeds_an_empty_registry_only(registry, tmp_path):
+    csv_file_path = str(tmp_path / "License_keys.csv")
+    write_csv(csv_file_path, [("OLD-1", "01-02-2029"), ("OLD-2", "REVOKED")])
+    registry.import_csv(csv_file_path)
+    registry.export_csv(csv_file_path)
+    assert read_csv(csv_file_path) == [("OLD-1", "01-02-2029"), ("OLD-2", "REVOKED")]
+
+    write_csv(csv_file_path, [("OLD-1", "REVOKED"), ("EDITED-3", "01-01-2099")])
+    registry.import_csv(csv_file_path)
+    assert registry.find("EDITED-3") is None
+    assert registry.find("OLD-1")[-1] == 0
+
+def test_counter_continues_after_row_id_invoices(key_generator, tmp_path):
+    path = str(tmp_path / "license_keys.db")
+    registry = key_generator.LicenseRegistry(path)
+    with registry.transaction() as cursor:
+        cursor.execute(" DROP TABLE counters ")
+        cursor.executemany(" INSERT INTO license_keys (license_key, expiration_date, invoice_number) VALUES (?, '2030-01-31', ?) ",
+            [("KEY-1", "INV2026010100001"), ("KEY-2", "INV2026010100002")])
+    registry.close()
+
+    registry = key_generator.LicenseRegistry(path)
+    try:
+        assert invoice_serials(issue(registry, "KEY-3", "KEY-4")) == [3, 4]
+    finally:
+        registry.close()
+
+@pytest.fixture
+def work_repo(key_generator, tmp_path, monkeypatch):
+    monkeypatch.setattr(key_generator.LicenseKeyGenerator, "SIGNING_KEY_FILE", str(tmp_path / "missing.pem"))
+    git = lambda *args: subprocess.run(["git", *args], check=True, capture_output=True)
+    git("init", "--bare", "-b", "master", str(tmp_path / "remote.git"))
+    git("clone", str(tmp_path / "remote.git"), str(tmp_path / "work"))
+    git("-C", str(tmp_path / "work"), "config", "user.email", "tests@example.com")
+    git("-C", str(tmp_path / "work"), "config", "user.name", "tests")
+    return tmp_path / "work"
+
+def test_batch_then_revoke_publish_to_a_bare_repo(key_generator, work_repo, tmp_path, capsys):
+    customers = tmp_path / "customers.csv"
+    customers.write_text("Name,Phone,Months\nAsha Rao,9000000001,1\nRavi Kumar,9000000002,12\n")
+    common = ["--repo", str(work_repo), "--registry", str(tmp_path / "license_keys.db")]
+
+    assert key_generator.batch_issue(["--batch", str(customers), "--no-invoices", *common]) == 0
+    issued = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert [row["Name"] for row in issued] == ["Asha Rao", "Ravi Kumar"]
+    assert invoice_serials([(None, row["Invoice Number"]) for row in issued]) == [1, 2]
+
+    revoked = issued[0]["License Key"]
+    assert key_generator.revoke_keys(["--revoke", "NOT-A-KEY", *common]) == 1
+    assert key_generator.revoke_keys(["--revoke", revoked, *common]) == 0
+
+    published = subprocess.run(["git", "--git-dir", str(tmp_path / "remote.git"), "show", "master:License_keys.csv"],
+        check=True, capture_output=True, text=True).stdout
+    assert dict(itertools.islice(csv.reader(published.splitlines()), 1, None)) == {
+        revoked: "REVOKED", issued[1]["License Key"]: issued[1]["Expiration Date"]}
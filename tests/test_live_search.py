@@ -0,0 +1,57 @@
+import pytest
+
+from conftest import Widget
+
+class Entry(Widget):
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+
+    def get(self):
+        return self.text
+
+class Tasks:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, func, *args, on_done=None, on_error=None):
+        self.submitted.append((func, args))
+
+    def shutdown(self):
+        pass
+
+@pytest.fixture
+def search_app(headless_app):
+    headless_app.tasks.shutdown()
+    headless_app.tasks = Tasks()
+    headless_app.populated = 0
+
+    def populate_treeview():
+        headless_app.populated += 1
+        headless_app.member_keys = []
+
+    headless_app.populate_treeview = populate_treeview
+    return headless_app
+
+def searching(app, query, member_keys):
+    app.search_box = Entry(query)
+    app.member_keys = member_keys
+    app.run_live_search()
+    return app
+
+def test_shortening_the_query_restores_the_month_view(search_app):
+    # member_keys is None while search results are shown.
+    searching(search_app, "ab", member_keys=None)
+    assert search_app.populated == 1
+    assert search_app.tasks.submitted == []
+
+def test_short_query_leaves_the_month_view_alone(search_app):
+    searching(search_app, "ab", member_keys=[])
+    assert search_app.populated == 0
+
+def test_a_long_enough_query_searches_off_the_tk_thread(search_app):
+    searching(search_app, "abc", member_keys=[])
+    assert len(search_app.tasks.submitted) == 1
+    func, args = search_app.tasks.submitted[0]
+    assert func == search_app.db.find_members
+    assert args[:2] == ("abc", search_app.SEARCH_RESULT_LIMIT)
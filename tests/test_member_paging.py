@@ -0,0 +1,111 @@
+import pytest
+
+from conftest import Tree, Widget
+
+class Month(Widget):
+    def get(self):
+        return "No Data Available"
+
+def member(member_id, activated, fees_paise=149950):
+    return (member_id, "Name", 30, "Male", "9000000000", "1 month's", fees_paise, "Cash", activated, "2026-02-01", "Active")
+
+@pytest.fixture
+def paging_app(headless_app):
+    headless_app.tree = Tree()
+    headless_app.member_scrollbar = Widget()
+    headless_app.member_scrollbar.set = lambda first, last: None
+    headless_app.selected_month = Month()
+    headless_app.member_rows = {}
+    headless_app.member_keys = []
+    headless_app.MEMBER_PAGE_SIZE = 2
+    headless_app.MEMBER_WINDOW_PAGES = 2
+    headless_app.member_window_start = ("", 0)
+    headless_app.member_page_after = ("2026-01-02", 2)
+    headless_app.member_pages_done = False
+    headless_app.member_page_loading = False
+    headless_app.member_month_range = None
+    return headless_app
+
+def serve_pages(app, pages):
+    app.fetch_member_page = lambda: pages.pop(0)
+
+def members(*member_ids):
+    return [member(member_id, f"2026-01-{member_id:02d}") for member_id in member_ids]
+
+def scroll(app, loop, first, last):
+    app.tree.view = (first, last)
+    app.on_member_tree_scroll(first, last)
+    loop.run_idle()
+
+def test_scrolling_queues_one_page_at_a_time(paging_app, loop):
+    serve_pages(paging_app, [[member(3, "2026-01-03"), member(4, "2026-01-04")]])
+    paging_app.on_member_tree_scroll(0.5, 0.9)
+    paging_app.on_member_tree_scroll(0.6, 0.95)
+    assert loop.pending().count(paging_app.load_member_page) == 1
+
+    loop.run_idle()
+    assert paging_app.tree.get_children() == ("3", "4")
+    assert paging_app.member_page_after == ("2026-01-04", 4)
+
+def test_rows_show_fees_in_their_own_column(paging_app, loop):
+    serve_pages(paging_app, [[member(3, "2026-01-03")]])
+    paging_app.on_member_tree_scroll(0.5, 0.9)
+    loop.run_idle()
+    values = paging_app.tree.item("3")["values"]
+    assert values[6:8] == ["Rs 1499.50", "Cash"]
+
+def test_a_failed_page_is_retried_on_the_next_scroll(paging_app, loop):
+    serve_pages(paging_app, [None, [member(3, "2026-01-03")]])
+    paging_app.on_member_tree_scroll(0.5, 0.9)
+    loop.run_idle()
+    assert not paging_app.member_pages_done
+
+    paging_app.on_member_tree_scroll(0.5, 0.9)
+    loop.run_idle()
+    assert paging_app.tree.get_children() == ("3",)
+    assert paging_app.member_pages_done
+
+def test_a_row_on_a_loading_page_is_not_in_view(paging_app):
+    serve_pages(paging_app, [])
+    paging_app.on_member_tree_scroll(0.5, 0.9)
+    assert paging_app.member_row_in_view(member(2, "2026-01-02"))
+    assert not paging_app.member_row_in_view(member(3, "2026-01-03"))
+
+def test_scrolling_down_keeps_a_fixed_window(paging_app, loop):
+    serve_pages(paging_app, [members(1, 2), members(3, 4), members(5, 6)])
+    paging_app.populate_treeview()
+    scroll(paging_app, loop, 0.5, 0.9)
+    assert paging_app.tree.get_children() == ("1", "2", "3", "4")
+
+    scroll(paging_app, loop, 0.75, 1.0)
+    assert paging_app.tree.get_children() == ("3", "4", "5", "6")
+    assert set(paging_app.member_rows) == {3, 4, 5, 6}
+    assert paging_app.member_window_start == ("2026-01-02", 2)
+    # Row 4 was at the top of the view before page 1 was dropped, and still is.
+    assert paging_app.tree.view[0] == 0.25
+    assert not paging_app.member_row_in_view(member(2, "2026-01-02"))
+    assert paging_app.member_row_in_view(member(3, "2026-01-03"))
+
+def test_scrolling_back_up_refetches_dropped_pages_by_keyset(paging_app, loop):
+    serve_pages(paging_app, [members(1, 2), members(3, 4), members(5, 6), members(5, 6)])
+    paging_app.populate_treeview()
+    scroll(paging_app, loop, 0.5, 0.9)
+    scroll(paging_app, loop, 0.75, 1.0)
+
+    paging_app.fetch_previous_member_page = lambda: members(2, 1)
+    scroll(paging_app, loop, 0.0, 0.5)
+    assert paging_app.tree.get_children() == ("1", "2", "3", "4")
+    assert paging_app.member_window_start == ("", 0)
+    assert paging_app.member_page_after == ("2026-01-04", 4)
+    assert not paging_app.member_pages_done
+    assert paging_app.tree.view[0] == 0.5
+
+    scroll(paging_app, loop, 0.5, 1.0)
+    assert paging_app.tree.get_children() == ("3", "4", "5", "6")
+
+def test_the_previous_page_query_returns_the_row_that_starts_the_window(paging_app):
+    with paging_app.db.transaction() as cursor:
+        cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status) VALUES ('Name', 30, 'Male', '9000000000', '1 month', 150000, 'Cash', ?, '2026-02-01', 'Active') """,
+            [(f"2026-01-{day:02d}",) for day in (1, 2, 2, 3, 4)])
+    paging_app.member_window_start = ("2026-01-03", 4)
+    assert [row[0] for row in paging_app.fetch_previous_member_page()] == [4, 3, 2]
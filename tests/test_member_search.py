@@ -0,0 +1,25 @@
+import pytest
+
+@pytest.fixture
+def db(gym, tmp_path):
+    db = gym.GymDatabase(str(tmp_path / "gym.db"))
+    db.init_schema()
+    db.migrate()
+    with db.transaction() as cursor:
+        if not db.has_name_search(cursor):
+            pytest.skip("this SQLite has no FTS5 trigram tokenizer")
+    yield db
+    db.close()
+
+def add_members(db, names):
+    with db.transaction() as cursor:
+        cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date) VALUES (?, 30, 'Male', '9000000000', '1 month', 150000, 'Cash', '2026-01-01', '2026-02-01') """,
+            [(name,) for name in names])
+
+def test_the_best_match_is_found_behind_many_weaker_ones(db):
+    add_members(db, [f"Ravindra Raveendran Kumar Subramanian {i}" for i in range(60)] + ["Ravi"])
+    assert [row[1] for row in db.find_members("rav", 3)][0] == "Ravi"
+
+def test_short_words_narrow_the_ranked_matches(db):
+    add_members(db, ["Ravi Jo", "Ravi Kumar", "Ravindra Jo"])
+    assert sorted(row[1] for row in db.find_members("rav jo", 10)) == ["Ravi Jo", "Ravindra Jo"]
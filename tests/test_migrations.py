@@ -0,0 +1,72 @@
+import sqlite3
+from datetime import date, timedelta
+
+LEGACY_MEMBERS = """ CREATE TABLE members (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    gender TEXT NOT NULL,
+    phone_number TEXT NOT NULL,
+    duration TEXT NOT NULL,
+    fees REAL NOT NULL,
+    payment_method TEXT NOT NULL,
+    date_of_activation TEXT NOT NULL,
+    expiration_date TEXT,
+    status TEXT NOT NULL DEFAULT 'Active' CHECK (status IN ('Active', 'Inactive')),
+    notified TEXT NOT NULL DEFAULT 'True' CHECK (notified IN ('True', 'False')))
+"""
+
+def legacy_database(path, members):
+    """Writes a database in the original schema: DD-MM-YYYY dates, "Rs N" fees and no user_version."""
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_MEMBERS)
+    conn.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees, payment_method,
+        date_of_activation, expiration_date, status, notified) VALUES (?, 25, 'Male', '9876543210', ?, 'Rs 500', 'Cash', ?, ?, ?, ?) """,
+        [(name, duration, activated.strftime("%d-%m-%Y"), expires.strftime("%d-%m-%Y") if expires else None, status, notified)
+            for name, duration, activated, expires, status, notified in members])
+    conn.commit()
+    conn.close()
+
+def migrated(gym, tmp_path, members):
+    path = str(tmp_path / "gym.db")
+    legacy_database(path, members)
+    db = gym.GymDatabase(path)
+    db.init_schema()
+    db.migrate()
+    return db
+
+def test_renewed_member_with_a_stale_expiry_stays_active(gym, tmp_path):
+    today = date.today()
+    db = migrated(gym, tmp_path, [
+        ("Renewed", "1 month's", today - timedelta(days=3), today - timedelta(days=40), "Active", "True")])
+
+    assert db.expire_members(today) == []
+    with db.transaction() as cursor:
+        cursor.execute(" SELECT expiration_date, status FROM members ")
+        assert cursor.fetchone() == (gym.add_months((today - timedelta(days=3)).isoformat(), 1), "Active")
+    db.close()
+
+def test_lapsed_and_unset_expiries_are_recomputed(gym, tmp_path):
+    today = date.today()
+    activated = today - timedelta(days=100)
+    db = migrated(gym, tmp_path, [
+        ("Lapsed", "3 month's", activated, today + timedelta(days=30), "Active", "True"),
+        ("Unset", "12 month's", activated, None, "Active", "True")])
+
+    assert db.expire_members(today) == [1]
+    with db.transaction() as cursor:
+        cursor.execute(" SELECT expiration_date FROM members ORDER BY id ")
+        assert [row[0] for row in cursor.fetchall()] == [
+            gym.add_months(activated.isoformat(), 3), gym.add_months(activated.isoformat(), 12)]
+    db.close()
+
+def test_inactive_members_keep_their_stored_expiry(gym, tmp_path):
+    today = date.today()
+    expired_on = today - timedelta(days=10)
+    db = migrated(gym, tmp_path, [
+        ("Inactive", "1 month's", today - timedelta(days=3), expired_on, "Inactive", "False")])
+
+    with db.transaction() as cursor:
+        cursor.execute(" SELECT expiration_date, notified FROM members ")
+        assert cursor.fetchone() == (expired_on.isoformat(), "False")
+    db.close()
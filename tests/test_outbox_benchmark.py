@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip("requests")
+
+def test_alerts_drain_through_the_stub_gateway(gym, outbox_benchmark, capsys):
+    status = outbox_benchmark.benchmark_outbox(["--messages", "40", "--concurrency", "4", "--latency-ms", "1",
+        "--failure-rate", "0.2", "--timeout", "60"])
+    output = capsys.readouterr().out
+
+    assert status == 0
+    assert "40 alert(s) queued" in output
+    assert "40 queued" in output
+    assert gym.messagebox.__name__ == "tkinter.messagebox"
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import tkinter as tk
+
+import pytest
+
+from conftest import ROOT
+
+HEAVY_MODULES = ("requests", "PIL", "pandas", "tkcalendar", "pywhatkit")
+
+def has_display():
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+def run_python(code, cwd=ROOT, timeout=60):
+    return subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, timeout=timeout)
+
+def test_loading_the_app_leaves_heavy_modules_unimported():
+    # A fresh interpreter, since other tests import some of these modules into this one.
+    result = run_python(f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("gym_manager", {os.path.join(ROOT, "GYM-MANAGER.py")!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))
+""")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+@pytest.mark.skipif(not has_display(), reason="needs a display for the Tk main window")
+def test_startup_profile_opens_the_window_within_budget(tmp_path):
+    # gym.db is created next to sys.executable, so point that at tmp_path for the run.
+    result = run_python(f"""
+import runpy, sys
+sys.executable = {str(tmp_path / "python")!r}
+sys.argv = ["GYM-MANAGER.py", "--startup-profile"]
+runpy.run_path({os.path.join(ROOT, "GYM-MANAGER.py")!r}, run_name="__main__")
+""", cwd=tmp_path)
+    assert "cold start:" in result.stdout, result.stderr
+    assert result.returncode == 0, result.stdout
+    assert (tmp_path / "gym.db").exists()
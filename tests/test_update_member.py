@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+
+import pytest
+
+from conftest import Field, Tree
+
+@pytest.fixture
+def member_view(headless_app):
+    today = date.today()
+    with headless_app.db.transaction() as cursor:
+        cursor.executemany(""" INSERT INTO members (name, age, gender, phone_number, duration, fees_paise, payment_method, date_of_activation, expiration_date, status) VALUES (?, 30, 'Male', '9000000000', '1 month', 150000, 'Cash', ?, ?, 'Active') """,
+            [("Edited", today.isoformat(), (today + timedelta(days=30)).isoformat()),
+             ("Lapsed", (today - timedelta(days=40)).isoformat(), (today - timedelta(days=10)).isoformat())])
+    headless_app.tree = Tree()
+    headless_app.member_scrollbar = Field()
+    headless_app.selected_month = Field("No Data Available")
+    headless_app.member_rows = {}
+    headless_app.member_keys = []
+    headless_app.populate_treeview()
+    return headless_app
+
+def edit(app, member_id, **fields):
+    values = dict(name="Edited", age="30", gender="Male", number="9000000000", duration="1 month", fees="1499.50",
+        payment="Cash", status="Active", activated=date.today())
+    values.update(fields)
+    app.entry_name, app.age_choice, app.gender = Field(values["name"]), Field(values["age"]), Field(values["gender"])
+    app.entry_number, app.duration_choice = Field(values["number"]), Field(values["duration"])
+    app.entry_fees, app.payment_method = Field(values["fees"]), Field(values["payment"])
+    app.status_choice, app.date_of_activation_entry = Field(values["status"]), Field(values["activated"])
+    app.member_window = Field()
+    app.update_member({"values": [member_id]})
+
+def statuses(app):
+    return {iid: app.tree.item(iid)["values"][10] for iid in app.tree.get_children()}
+
+def test_members_expired_by_an_edit_are_patched_too(member_view):
+    assert statuses(member_view) == {"1": "Active", "2": "Active"}
+
+    edit(member_view, 1)
+    assert statuses(member_view) == {"1": "Active", "2": "Inactive"}
+    assert member_view.tree.item("1")["values"][6] == "Rs 1499.50"
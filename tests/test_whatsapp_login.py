@@ -0,0 +1,48 @@
+import pytest
+
+class Transport:
+    login_url = "https://web.whatsapp.com/"
+
+class Dispatcher:
+    woken = 0
+
+    def wake(self):
+        self.woken += 1
+
+@pytest.fixture
+def login_app(headless_app):
+    headless_app.online = True
+    headless_app.transport = Transport()
+    headless_app.dispatcher = Dispatcher()
+    headless_app.inactive_month_range = ("2000-01-01", "2000-02-01")
+    headless_app.open_whatsapp_web = lambda: None
+    return headless_app
+
+def queue_reminder(app):
+    app.db.enqueue_notifications([(1, "reminder", "2030-01-31", "+919000000000", "Hi")])
+
+def test_nothing_due_does_not_ask(login_app, dialogs):
+    login_app.offer_whatsapp_login()
+    assert dialogs.shown == []
+
+def test_due_messages_wait_without_asking(login_app, loop, dialogs):
+    queue_reminder(login_app)
+    assert not login_app.outbox_ready()
+    loop.run_idle()
+    assert dialogs.shown == []
+
+def test_gym_accounts_asks_once_and_sends_after_login(login_app, dialogs):
+    queue_reminder(login_app)
+    dialogs.answers = [True, True]
+    login_app.offer_whatsapp_login()
+    login_app.offer_whatsapp_login()
+    assert dialogs.titles("question") == ["WhatsApp Login", "WhatsApp Login"]
+    assert login_app.whatsapp_confirmed
+    assert login_app.dispatcher.woken == 1
+
+def test_alert_asks_for_login_without_unnotified_members(login_app, dialogs):
+    queue_reminder(login_app)
+    dialogs.answers = [True]
+    login_app.send_whatsapp_message()
+    assert login_app.whatsapp_confirmed
+    assert login_app.dispatcher.woken == 1